@@ -6,7 +6,6 @@ from typing import List
 
 from permifrost.core.permissions import SpecLoadingError
 from permifrost.core.permissions.snowflake_spec_loader import SnowflakeSpecLoader
-from permifrost.core.permissions.utils.snowflake_connector import SnowflakeConnector
 from . import cli
 
 
@@ -58,26 +57,39 @@ def grant(spec, dry, diff, role):
             click.secho("SQL Commands generated for given spec file:")
         click.secho()
 
-        conn = SnowflakeConnector()
-        for query in sql_grant_queries:
-            if not dry:
-                status = None
-                if not query.get("already_granted"):
-                    try:
-                        conn.run_query(query.get("sql"))
-                        status = True
-                    except:
-                        status = False
+        # Reuse the loader's connector so the whole run shares one engine
+        # (and its already-authenticated session and schema cache)
+        conn = spec_loader.get_connector()
+        encountered_error = False
+
+        if not dry:
+            # Run every query that needs granting as one batch over a single
+            # connection instead of checking one out of the pool per statement
+            queries_to_run = [
+                query for query in sql_grant_queries if not query.get("already_granted")
+            ]
+            statuses = conn.run_queries([query.get("sql") for query in queries_to_run])
 
-                    ran_query = query
-                    ran_query["run_status"] = status
-                    print_command(ran_query, diff)
-                # If already granted, print command
-                else:
-                    print_command(query, diff)
-            # If dry, print commands
-            else:
+            # run_queries yields each status as its query completes, so every
+            # command is printed as soon as its result is known
+            for query in sql_grant_queries:
+                if not query.get("already_granted"):
+                    status = next(statuses)
+                    query["run_status"] = status
+                    if not status:
+                        encountered_error = True
+                # Already granted commands have no run status
+                # and are printed as skipped
                 print_command(query, diff)
+        # If dry, print commands
+        else:
+            for query in sql_grant_queries:
+                print_command(query, diff)
+
+        # Propagate query failures to the exit code so callers
+        # (CI pipelines, schedulers) can tell a failed run from a clean one
+        if encountered_error:
+            sys.exit(1)
 
     except SpecLoadingError as exc:
         for line in str(exc).splitlines():
@@ -6,6 +6,14 @@ import re
 
 from typing import Dict, List, Tuple, Optional
 
+# Use the libyaml C parser when PyYAML was built with it - an order of
+# magnitude faster for large spec files - and fall back to the pure Python
+# SafeLoader otherwise
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 from permifrost.core.permissions.utils.error import SpecLoadingError
 from permifrost.core.permissions.utils.snowflake_connector import SnowflakeConnector
 from permifrost.core.permissions.spec_schemas.snowflake import *
@@ -17,6 +25,10 @@ VALIDATION_ERR_MSG = 'Spec error: {} "{}", field "{}": {}'
 
 class SnowflakeSpecLoader:
     def __init__(self, spec_path: str, conn: SnowflakeConnector = None) -> None:
+        # Keep a single connector (and hence a single SQLAlchemy engine) for
+        # the whole run instead of each step creating its own
+        self.conn = conn
+
         # Load the specification file and check for (syntactical) errors
         click.secho("Loading spec file", fg="green")
         self.spec = self.load_spec(spec_path)
@@ -48,6 +60,16 @@ class SnowflakeSpecLoader:
         self.roles_granted_to_user = {}
         self.get_privileges_from_snowflake_server(conn)
 
+    def get_connector(self) -> SnowflakeConnector:
+        """
+        Return the connector passed on initialization, creating (and caching)
+        one if none was provided.
+        """
+        if self.conn is None:
+            self.conn = SnowflakeConnector()
+
+        return self.conn
+
     def load_spec(self, spec_path: str) -> Dict:
         """
         Load a permissions specification from a file.
@@ -65,7 +87,7 @@ class SnowflakeSpecLoader:
         """
         try:
             with open(spec_path, "r") as stream:
-                spec = yaml.safe_load(stream)
+                spec = yaml.load(stream, Loader=SafeLoader)
         except FileNotFoundError:
             raise SpecLoadingError(f"Spec File {spec_path} not found")
 
@@ -95,7 +117,9 @@ class SnowflakeSpecLoader:
         """
         error_messages = []
 
-        validator = cerberus.Validator(yaml.safe_load(SNOWFLAKE_SPEC_SCHEMA))
+        validator = cerberus.Validator(
+            yaml.load(SNOWFLAKE_SPEC_SCHEMA, Loader=SafeLoader)
+        )
         validator.validate(spec)
         for entity_type, err_msg in validator.errors.items():
             if isinstance(err_msg[0], str):
@@ -109,10 +133,10 @@ class SnowflakeSpecLoader:
             return error_messages
 
         schema = {
-            "databases": yaml.safe_load(SNOWFLAKE_SPEC_DATABASE_SCHEMA),
-            "roles": yaml.safe_load(SNOWFLAKE_SPEC_ROLE_SCHEMA),
-            "users": yaml.safe_load(SNOWFLAKE_SPEC_USER_SCHEMA),
-            "warehouses": yaml.safe_load(SNOWFLAKE_SPEC_WAREHOUSE_SCHEMA),
+            "databases": yaml.load(SNOWFLAKE_SPEC_DATABASE_SCHEMA, Loader=SafeLoader),
+            "roles": yaml.load(SNOWFLAKE_SPEC_ROLE_SCHEMA, Loader=SafeLoader),
+            "users": yaml.load(SNOWFLAKE_SPEC_USER_SCHEMA, Loader=SafeLoader),
+            "warehouses": yaml.load(SNOWFLAKE_SPEC_WAREHOUSE_SCHEMA, Loader=SafeLoader),
         }
 
         validators = {
@@ -566,7 +590,7 @@ class SnowflakeSpecLoader:
         self, conn: SnowflakeConnector = None
     ) -> None:
         if conn is None:
-            conn = SnowflakeConnector()
+            conn = self.get_connector()
         error_messages = []
 
         click.secho(f"  Current user is: {conn.get_current_user()}.", fg="green")
@@ -595,7 +619,7 @@ class SnowflakeSpecLoader:
         error_messages = []
 
         if conn is None:
-            conn = SnowflakeConnector()
+            conn = self.get_connector()
 
         if len(self.entities["warehouses"]) > 0:
             warehouses = conn.show_warehouses()
@@ -691,7 +715,7 @@ class SnowflakeSpecLoader:
         Consolidates role and future privileges into a single object for self.grants_to_role
         """
         if conn is None:
-            conn = SnowflakeConnector()
+            conn = self.get_connector()
 
         future_grants = {}
         for database in self.entities["database_refs"]:
@@ -750,7 +774,7 @@ class SnowflakeSpecLoader:
         sql_commands = []
 
         generator = SnowflakeGrantsGenerator(
-            self.grants_to_role, self.roles_granted_to_user
+            self.grants_to_role, self.roles_granted_to_user, conn=self.conn
         )
 
         click.secho("Generating permission Queries:", fg="green")
@@ -807,30 +831,32 @@ class SnowflakeSpecLoader:
         return self.remove_duplicate_queries(sql_commands)
 
     def remove_duplicate_queries(self, sql_commands: Dict) -> List[Dict]:
-        grants = []
-        revokes = []
-
-        for i, command in reversed(list(enumerate(sql_commands))):
-            # Find all "GRANT OWNERSHIP commands"
+        grants = set()
+        revokes = set()
+        deduplicated_commands = []
+
+        # Walk the commands backwards so that when a GRANT OWNERSHIP or a
+        #  REVOKE ALL appears more than once for the same DB/SCHEMA/TABLE,
+        #  only the last one is kept
+        for command in reversed(sql_commands):
             if command["sql"].startswith("GRANT OWNERSHIP ON"):
                 grant = command["sql"].split("TO ROLE", 1)[0]
 
                 if grant in grants:
-                    # If there is already a GRANT OWNERSHIP for the same
-                    #  DB/SCHEMA/TABLE --> remove the one before it
-                    #  (only keep the last one)
-                    del sql_commands[i]
-                else:
-                    grants.append(grant)
+                    continue
+
+                grants.add(grant)
 
             if command["sql"].startswith("REVOKE ALL"):
                 revoke = command["sql"]
+
                 if revoke in revokes:
-                    # If there is already a REVOKE ALL for the same
-                    #  DB/SCHEMA/TABLE --> remove the one before it
-                    #  (only keep the last one)
-                    del sql_commands[i]
-                else:
-                    revokes.append(revoke)
-
-        return sql_commands
+                    continue
+
+                revokes.add(revoke)
+
+            deduplicated_commands.append(command)
+
+        deduplicated_commands.reverse()
+
+        return deduplicated_commands
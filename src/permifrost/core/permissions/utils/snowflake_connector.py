@@ -3,7 +3,7 @@ import os
 import re
 import sqlalchemy
 
-from typing import Dict, List, Any
+from typing import Dict, Iterator, List, Any
 from snowflake.sqlalchemy import URL
 
 # To support key pair authentication
@@ -18,6 +18,12 @@ for logger_name in ["snowflake.connector", "botocore", "boto3"]:
     logger.setLevel(logging.WARNING)
 
 
+# Regexes used by snowflaky(), compiled once at import time as snowflaky
+# runs for every name in every generated statement
+SNOWFLAKY_PROPER_NAME_REGEX = re.compile("^[0-9a-zA-Z_]*$")
+SNOWFLAKY_QUOTED_NAME_REGEX = re.compile('^".*"$')
+
+
 class SnowflakeConnector:
     def __init__(self, config: Dict = None) -> None:
         if not config:
@@ -71,6 +77,12 @@ class SnowflakeConnector:
                 )
             )
 
+        # Cache for SHOW SCHEMAS results, keyed by database (None for the
+        # account level listing). A run only issues GRANT/REVOKE/ALTER
+        # statements, so the schema listing can not change underneath us and
+        # it is safe to reuse it instead of re-querying Snowflake every time.
+        self.schemas_cache: Dict[Any, List[str]] = {}
+
     def generate_private_key(self, key_path: str, key_passphrase: str) -> str:
         with open(key_path, "rb") as key:
             p_key = serialization.load_pem_private_key(
@@ -84,19 +96,18 @@ class SnowflakeConnector:
         )
 
     def show_query(self, entity) -> List[str]:
-        names = []
-
         query = f"SHOW {entity}"
         with self.engine.connect() as connection:
-            results = connection.execute(query).fetchall()
+            results = connection.execute(query)
 
-            for result in results:
-                names.append(result["name"].lower())
+            names = [result["name"].lower() for result in results]
 
         return names
 
     def show_databases(self) -> List[str]:
-        return self.show_query("DATABASES")
+        # TERSE skips the comment/options/retention columns -
+        # only the names are consumed anyway
+        return self.show_query("TERSE DATABASES")
 
     def show_warehouses(self) -> List[str]:
         return self.show_query("WAREHOUSES")
@@ -105,7 +116,8 @@ class SnowflakeConnector:
         return self.show_query("USERS")
 
     def show_schemas(self, database: str = None) -> List[str]:
-        names = []
+        if database in self.schemas_cache:
+            return self.schemas_cache[database]
 
         if database:
             query = f"SHOW TERSE SCHEMAS IN DATABASE {database}"
@@ -113,18 +125,18 @@ class SnowflakeConnector:
             query = "SHOW TERSE SCHEMAS IN ACCOUNT"
 
         with self.engine.connect() as connection:
-            results = connection.execute(query).fetchall()
+            results = connection.execute(query)
 
-            for result in results:
-                names.append(
-                    f"{result['database_name'].lower()}.{result['name'].lower()}"
-                )
+            names = [
+                f"{result['database_name'].lower()}.{result['name'].lower()}"
+                for result in results
+            ]
+
+        self.schemas_cache[database] = names
 
         return names
 
     def show_tables(self, database: str = None, schema: str = None) -> List[str]:
-        names = []
-
         if schema:
             query = f"SHOW TERSE TABLES IN SCHEMA {schema}"
         elif database:
@@ -133,20 +145,18 @@ class SnowflakeConnector:
             query = "SHOW TERSE TABLES IN ACCOUNT"
 
         with self.engine.connect() as connection:
-            results = connection.execute(query).fetchall()
+            results = connection.execute(query)
 
-            for result in results:
-                names.append(
-                    f"{result['database_name'].lower()}"
-                    + f".{result['schema_name'].lower()}"
-                    + f".{result['name'].lower()}"
-                )
+            names = [
+                f"{result['database_name'].lower()}"
+                f".{result['schema_name'].lower()}"
+                f".{result['name'].lower()}"
+                for result in results
+            ]
 
         return names
 
     def show_views(self, database: str = None, schema: str = None) -> List[str]:
-        names = []
-
         if schema:
             query = f"SHOW TERSE VIEWS IN SCHEMA {schema}"
         elif database:
@@ -155,14 +165,14 @@ class SnowflakeConnector:
             query = "SHOW TERSE VIEWS IN ACCOUNT"
 
         with self.engine.connect() as connection:
-            results = connection.execute(query).fetchall()
+            results = connection.execute(query)
 
-            for result in results:
-                names.append(
-                    f"{result['database_name'].lower()}"
-                    + f".{result['schema_name'].lower()}"
-                    + f".{result['name'].lower()}"
-                )
+            names = [
+                f"{result['database_name'].lower()}"
+                f".{result['schema_name'].lower()}"
+                f".{result['name'].lower()}"
+                for result in results
+            ]
 
         return names
 
@@ -177,7 +187,7 @@ class SnowflakeConnector:
             pass
 
         with self.engine.connect() as connection:
-            results = connection.execute(query).fetchall()
+            results = connection.execute(query)
 
             for result in results:
                 if result["grant_to"] == "ROLE":
@@ -199,7 +209,7 @@ class SnowflakeConnector:
 
         query = f"SHOW GRANTS TO ROLE {SnowflakeConnector.snowflaky(role)}"
         with self.engine.connect() as connection:
-            results = connection.execute(query).fetchall()
+            results = connection.execute(query)
 
             for result in results:
                 privilege = result["privilege"].lower()
@@ -212,14 +222,11 @@ class SnowflakeConnector:
         return grants
 
     def show_roles_granted_to_user(self, user) -> List[str]:
-        roles = []
-
         query = f"SHOW GRANTS TO USER {SnowflakeConnector.snowflaky(user)}"
         with self.engine.connect() as connection:
-            results = connection.execute(query).fetchall()
+            results = connection.execute(query)
 
-            for result in results:
-                roles.append(result["role"].lower())
+            roles = [result["role"].lower() for result in results]
 
         return roles
 
@@ -234,14 +241,10 @@ class SnowflakeConnector:
         return result["role"].lower()
 
     def show_roles(self) -> Dict[str, str]:
-        roles = {}
-
         query = "SHOW ROLES"
         results = self.run_query(query).fetchall()
 
-        for result in results:
-            roles[result["name"].lower()] = result["owner"].lower()
-        return roles
+        return {result["name"].lower(): result["owner"].lower() for result in results}
 
     def run_query(self, query: str):
 
@@ -250,6 +253,25 @@ class SnowflakeConnector:
 
         return result
 
+    def run_queries(self, queries: List[str]) -> Iterator[bool]:
+        """
+        Run a batch of queries over a single connection instead of checking
+        one out of the pool for every statement.
+
+        A failing query is logged and does not stop the batch.
+
+        Yields the success status of each query, in order, as it completes
+        so that callers can report progress while the batch is running.
+        """
+        with self.engine.connect() as connection:
+            for query in queries:
+                try:
+                    connection.execute(query)
+                    yield True
+                except Exception as err:
+                    logging.error(f"Query failed: {err}")
+                    yield False
+
     def full_schema_list(self, schema: str) -> List[str]:
         """
         For a given schema name, get all schemas it may be referencing.
@@ -313,8 +335,8 @@ class SnowflakeConnector:
 
         for part in name_parts:
             if (
-                re.match("^[0-9a-zA-Z_]*$", part) is None  # Proper formatting
-                and re.match('^".*"$', part) is None  # Already quoted
+                SNOWFLAKY_PROPER_NAME_REGEX.match(part) is None  # Proper formatting
+                and SNOWFLAKY_QUOTED_NAME_REGEX.match(part) is None  # Already quoted
             ):
                 new_name_parts.append(f'"{part}"')
             else:
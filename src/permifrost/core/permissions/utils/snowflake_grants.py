@@ -31,11 +31,31 @@ GRANT_OWNERSHIP_TEMPLATE = (
     " TO ROLE {role_name} COPY CURRENT GRANTS"
 )
 
+# Compiled once at import time as check_grant_to_role runs for every
+# privilege/entity pair in the spec
+FUTURE_GRANT_REGEX = re.compile(r"<(table|view|schema)>")
+
 
 class SnowflakeGrantsGenerator:
-    def __init__(self, grants_to_role: Dict, roles_granted_to_user: Dict) -> None:
+    def __init__(
+        self,
+        grants_to_role: Dict,
+        roles_granted_to_user: Dict,
+        conn: SnowflakeConnector = None,
+    ) -> None:
         self.grants_to_role = grants_to_role
         self.roles_granted_to_user = roles_granted_to_user
+        self.conn = conn
+
+    def get_connector(self) -> SnowflakeConnector:
+        """
+        Return the connector passed on initialization, creating (and caching)
+        one if none was provided.
+        """
+        if self.conn is None:
+            self.conn = SnowflakeConnector()
+
+        return self.conn
 
     def check_grant_to_role(
         self, role: str, privilege: str, entity_type: str, entity_name: str
@@ -51,7 +71,7 @@ class SnowflakeGrantsGenerator:
         means that role reported has been granted the privilege to use the
         Database ANALYTICS on the Snowflake server.
         """
-        future = True if re.search(r"<(table|view|schema)>", entity_name) else False
+        future = True if FUTURE_GRANT_REGEX.search(entity_name) else False
 
         grants = (
             self.grants_to_role.get(role, {}).get(privilege, {}).get(entity_type, [])
@@ -96,7 +116,7 @@ class SnowflakeGrantsGenerator:
             member_exclude_list = []
 
         if len(member_include_list) == 1 and member_include_list[0] == "*":
-            conn = SnowflakeConnector()
+            conn = self.get_connector()
             show_roles = conn.show_roles()
             member_include_list = [
                 role for role in show_roles if role in all_entities and role != entity
@@ -495,12 +515,15 @@ class SnowflakeGrantsGenerator:
         # The "Usage" privilege is consistent across read and write.
         # Compare granted usage to full read/write usage set
         # and revoke missing ones
+        # The spec'd databases don't change while revoking, so build the
+        # combined list once instead of once per granted database
+        all_databases = set(databases.get("read", []) + databases.get("write", []))
+
         for granted_database in (
             self.grants_to_role.get(role, {}).get("usage", {}).get("database", [])
         ):
             # If it's a shared database, only revoke imported
             # We'll only know if it's a shared DB based on the spec
-            all_databases = databases.get("read", []) + databases.get("write", [])
             if granted_database not in spec_dbs:
                 # Skip revocation on database that are not defined in spec
                 continue
@@ -625,7 +648,7 @@ class SnowflakeGrantsGenerator:
             if database in shared_dbs:
                 continue
 
-            conn = SnowflakeConnector()
+            conn = self.get_connector()
             fetched_schemas = conn.full_schema_list(schema)
             read_grant_schemas.extend(fetched_schemas)
 
@@ -683,7 +706,7 @@ class SnowflakeGrantsGenerator:
             if database in shared_dbs:
                 continue
 
-            conn = SnowflakeConnector()
+            conn = self.get_connector()
             fetched_schemas = conn.full_schema_list(schema)
             write_grant_schemas.extend(fetched_schemas)
 
@@ -741,10 +764,13 @@ class SnowflakeGrantsGenerator:
 
         # The "usage" privilege is consistent across read and write.
         # Compare granted usage to full read/write set and revoke missing ones
+        # The grant lists are complete once the GRANT statements above have
+        # been generated, so build the combined set once up front
+        all_grant_schemas = set(read_grant_schemas + write_grant_schemas)
+
         for granted_schema in list(
             set(self.grants_to_role.get(role, {}).get("usage", {}).get("schema", []))
         ):
-            all_grant_schemas = read_grant_schemas + write_grant_schemas
             database_name = granted_schema.split(".")[0]
             future_schema_name = f"{database_name}.<schema>"
             if granted_schema not in all_grant_schemas and (
@@ -888,7 +914,7 @@ class SnowflakeGrantsGenerator:
         write_privileges = f"{read_privileges}, {write_partial_privileges}"
         write_privileges_array = write_privileges.split(", ")
 
-        conn = SnowflakeConnector()
+        conn = self.get_connector()
 
         for table in tables.get("read", []):
             # Split the table identifier into parts {DB_NAME}.{SCHEMA_NAME}.{TABLE_NAME}
@@ -911,13 +937,29 @@ class SnowflakeGrantsGenerator:
 
             fetched_schemas = conn.full_schema_list(f"{name_parts[0]}.{name_parts[1]}")
 
-            for schema in fetched_schemas:
-                # Fetch all tables from Snowflake for each schema and add
-                # to the read_tables_list[] and read_views_list[] variables.
-                # This is so we can check that a table given in the config
-                # Is valid
-                read_table_list.extend(conn.show_tables(schema=schema))
-                read_view_list.extend(conn.show_views(schema=schema))
+            # Fetch all tables/views from Snowflake and add to the
+            # read_table_list[] and read_view_list[] variables.
+            # This is so we can check that a table given in the config
+            # Is valid
+            if "*" in name_parts[1]:
+                # A wildcard schema references tables in multiple schemas,
+                # so fetch the whole database with a single SHOW call and
+                # filter locally instead of issuing one call per schema
+                schemas_to_match = set(fetched_schemas)
+                read_table_list.extend(
+                    db_table
+                    for db_table in conn.show_tables(database=name_parts[0])
+                    if db_table.rsplit(".", 1)[0] in schemas_to_match
+                )
+                read_view_list.extend(
+                    db_view
+                    for db_view in conn.show_views(database=name_parts[0])
+                    if db_view.rsplit(".", 1)[0] in schemas_to_match
+                )
+            else:
+                for schema in fetched_schemas:
+                    read_table_list.extend(conn.show_tables(schema=schema))
+                    read_view_list.extend(conn.show_views(schema=schema))
 
             if name_parts[2] == "*":
                 # If <schema_name>.* then you add all tables to grant list and then grant future
@@ -1050,13 +1092,29 @@ class SnowflakeGrantsGenerator:
 
             fetched_schemas = conn.full_schema_list(f"{name_parts[0]}.{name_parts[1]}")
 
-            for schema in fetched_schemas:
-                # Fetch all tables from Snowflake for each schema and add
-                # to the write_tables_list[] and write_views_list[] variables.
-                # This is so we can check that a table given in the config
-                # Is valid
-                write_table_list.extend(conn.show_tables(schema=schema))
-                write_view_list.extend(conn.show_views(schema=schema))
+            # Fetch all tables/views from Snowflake and add to the
+            # write_table_list[] and write_view_list[] variables.
+            # This is so we can check that a table given in the config
+            # Is valid
+            if "*" in name_parts[1]:
+                # A wildcard schema references tables in multiple schemas,
+                # so fetch the whole database with a single SHOW call and
+                # filter locally instead of issuing one call per schema
+                schemas_to_match = set(fetched_schemas)
+                write_table_list.extend(
+                    db_table
+                    for db_table in conn.show_tables(database=name_parts[0])
+                    if db_table.rsplit(".", 1)[0] in schemas_to_match
+                )
+                write_view_list.extend(
+                    db_view
+                    for db_view in conn.show_views(database=name_parts[0])
+                    if db_view.rsplit(".", 1)[0] in schemas_to_match
+                )
+            else:
+                for schema in fetched_schemas:
+                    write_table_list.extend(conn.show_tables(schema=schema))
+                    write_view_list.extend(conn.show_views(schema=schema))
 
             if name_parts[2] == "*":
                 # If <schema_name>.* then you add all tables to grant list and then grant future
@@ -1180,10 +1238,14 @@ class SnowflakeGrantsGenerator:
         # Read Privileges
         # The "select" privilege is consistent across read and write.
         # Compare granted usage to full read/write set and revoke missing ones
+        # The grant lists are complete once the GRANT statements above have
+        # been generated, so build the combined sets once up front
+        all_grant_tables = set(read_grant_tables_full + write_grant_tables_full)
+        all_grant_views = set(read_grant_views_full + write_grant_views_full)
+
         for granted_table in list(
             set(self.grants_to_role.get(role, {}).get("select", {}).get("table", []))
         ):
-            all_grant_tables = read_grant_tables_full + write_grant_tables_full
             table_split = granted_table.split(".")
             database_name = table_split[0]
             table_name = table_split[-1]
@@ -1243,7 +1305,6 @@ class SnowflakeGrantsGenerator:
         for granted_view in list(
             set(self.grants_to_role.get(role, {}).get("select", {}).get("view", []))
         ):
-            all_grant_views = read_grant_views_full + write_grant_views_full
             view_split = granted_view.split(".")
             database_name = view_split[0]
             view_name = view_split[-1]
@@ -1443,7 +1504,7 @@ class SnowflakeGrantsGenerator:
                 schemas = []
 
                 if name_parts[1] == "*":
-                    conn = SnowflakeConnector()
+                    conn = self.get_connector()
                     db_schemas = conn.show_schemas(name_parts[0])
 
                     for db_schema in db_schemas:
@@ -1485,7 +1546,7 @@ class SnowflakeGrantsGenerator:
 
                 if name_parts[2] == "*":
                     schemas = []
-                    conn = SnowflakeConnector()
+                    conn = self.get_connector()
 
                     if name_parts[1] == "*":
                         db_schemas = conn.show_schemas(name_parts[0])
@@ -88,6 +88,36 @@ class TestSnowflakeConnector:
 
         assert result is expectedResult
 
+    def test_run_queries_executes_all_queries(self, mocker):
+        mocker.patch("sqlalchemy.create_engine")
+        conn = SnowflakeConnector()
+        queries = ["FIRST TESTING QUERY", "SECOND TESTING QUERY"]
+
+        statuses = list(conn.run_queries(queries))
+
+        conn.engine.assert_has_calls(
+            [
+                mocker.call.connect().__enter__().execute("FIRST TESTING QUERY"),
+                mocker.call.connect().__enter__().execute("SECOND TESTING QUERY"),
+            ]
+        )
+        assert statuses == [True, True]
+
+    def test_run_queries_reports_failed_queries(self, mocker):
+        mocker.patch("sqlalchemy.create_engine")
+        conn = SnowflakeConnector()
+        mocker.patch.object(
+            conn.engine.connect().__enter__(),
+            "execute",
+            side_effect=[Exception("Query error"), "MY DATABASE RESULT"],
+        )
+
+        statuses = list(
+            conn.run_queries(["FIRST TESTING QUERY", "SECOND TESTING QUERY"])
+        )
+
+        assert statuses == [False, True]
+
     def test_get_current_user(self, mocker):
         mocker.patch("sqlalchemy.create_engine")
         conn = SnowflakeConnector()
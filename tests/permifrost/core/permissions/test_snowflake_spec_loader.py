@@ -345,6 +345,51 @@ class TestSnowflakeSpecLoader:
 
         assert [] == queries
 
+    def test_remove_duplicate_queries(self, test_dir, mock_connector):
+        """Only the last GRANT OWNERSHIP/REVOKE ALL for an entity is kept."""
+
+        spec_loader = SnowflakeSpecLoader(
+            os.path.join(test_dir, "specs", "snowflake_spec_blank.yml"), mock_connector
+        )
+
+        sql_commands = [
+            {
+                "already_granted": False,
+                "sql": "GRANT OWNERSHIP ON database db1 TO ROLE role_a COPY CURRENT GRANTS",
+            },
+            {
+                "already_granted": False,
+                "sql": "REVOKE ALL PRIVILEGES ON database db1 FROM ROLE role_b",
+            },
+            {
+                "already_granted": False,
+                "sql": "GRANT USAGE ON database db1 TO ROLE role_a",
+            },
+            {
+                "already_granted": True,
+                "sql": "GRANT OWNERSHIP ON database db1 TO ROLE role_b COPY CURRENT GRANTS",
+            },
+            {
+                "already_granted": False,
+                "sql": "REVOKE ALL PRIVILEGES ON database db1 FROM ROLE role_b",
+            },
+        ]
+
+        assert spec_loader.remove_duplicate_queries(sql_commands) == [
+            {
+                "already_granted": False,
+                "sql": "GRANT USAGE ON database db1 TO ROLE role_a",
+            },
+            {
+                "already_granted": True,
+                "sql": "GRANT OWNERSHIP ON database db1 TO ROLE role_b COPY CURRENT GRANTS",
+            },
+            {
+                "already_granted": False,
+                "sql": "REVOKE ALL PRIVILEGES ON database db1 FROM ROLE role_b",
+            },
+        ]
+
     def test_role_filter(self, mocker, test_roles_mock_connector, test_roles_spec_file):
         """Make sure that the grant queries list can be filtered by role."""
 